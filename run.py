@@ -11,10 +11,15 @@ load_dotenv()
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     debug = os.getenv("DEBUG", "False").lower() == "true"
-    
+
     uvicorn.run(
         "src.api.app:app",
         host="0.0.0.0",
         port=port,
-        reload=debug
-    ) 
\ No newline at end of file
+        reload=debug,
+        # uvloop + httptools are substantially faster than the stock asyncio
+        # loop and h11 parser; keep the stock loop in debug mode for reload
+        loop="asyncio" if debug else "uvloop",
+        http="httptools",
+        workers=1 if debug else int(os.getenv("WORKERS", os.cpu_count() or 1))
+    )
@@ -1,102 +1,265 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-from src.guardrails.base import GuardrailRegistry
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import anyio
+import msgspec
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from typing import Annotated, List, Dict, Any, Optional, Union
+from src.guardrails import registry
+from src.guardrails.base import GuardrailCapability
 from src.guardrails.pii import PIIGuardrail
 from src.guardrails.topic import TopicGuardrail
+from src.guardrails.word_filter import WordFilterGuardrail
+
+# Bounded pool for running sync guardrail code off the event loop
+_executor: Optional[ThreadPoolExecutor] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _executor
+    max_workers = int(os.getenv("GUARDRAIL_WORKERS", os.cpu_count() or 4))
+    _executor = ThreadPoolExecutor(max_workers=max_workers)
+    # Bound anyio's worker threads the same way so concurrent ML calls
+    # don't thrash the CPU
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max_workers
+    # Warm guardrail models in a worker thread so the event loop stays free
+    # while the server starts accepting traffic
+    await anyio.to_thread.run_sync(registry.warmup)
+    yield
+    _executor.shutdown(wait=False)
 
 app = FastAPI(
     title="LLM Guardrails Service",
     description="A service for implementing safety and quality controls on Large Language Model outputs",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes the nested response dicts far faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
-# Initialize registry and register guardrails
-registry = GuardrailRegistry()
+# Register guardrails on the shared registry
 registry.register(PIIGuardrail())
 registry.register(TopicGuardrail())
+registry.register(WordFilterGuardrail())
 
-class ValidateRequest(BaseModel):
-    content: str
+# Non-empty list of strings, enforced by msgspec's native decoder rather
+# than a Python-level validator looping over the items
+Content = Union[str, Annotated[List[str], msgspec.Meta(min_length=1)]]
+
+# Request bodies are decoded with msgspec, whose C decoder validates plain
+# structs far faster than a per-request Pydantic model
+class ValidateRequest(msgspec.Struct):
+    content: Content
     guardrails: List[str]
     options: Optional[Dict[str, Any]] = None
 
-class TransformRequest(BaseModel):
-    content: str
+class TransformRequest(msgspec.Struct):
+    content: Content
     guardrails: List[str]
     options: Optional[Dict[str, Any]] = None
 
+_validate_decoder = msgspec.json.Decoder(ValidateRequest)
+_transform_decoder = msgspec.json.Decoder(TransformRequest)
+
+async def _parse_validate_request(raw: Request) -> ValidateRequest:
+    try:
+        return _validate_decoder.decode(await raw.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+async def _parse_transform_request(raw: Request) -> TransformRequest:
+    try:
+        return _transform_decoder.decode(await raw.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+_CAPABILITY_ACTIONS = {
+    GuardrailCapability.VALIDATE: "validation",
+    GuardrailCapability.TRANSFORM: "transformation",
+}
+
+# Shared empty-options sentinel; guardrails treat options as read-only
+_EMPTY_OPTIONS: Dict[str, Any] = {}
+
+def _resolve_guardrails(request, capability: GuardrailCapability):
+    """Resolve guardrail ids to (id, guardrail, options) tuples, raising 400
+    for unknown ids or unsupported capabilities before any work starts."""
+    opts_by_gid = request.options or _EMPTY_OPTIONS
+    resolved = []
+    for guardrail_id in request.guardrails:
+        guardrail = registry.get(guardrail_id)
+        if not guardrail:
+            raise HTTPException(status_code=400, detail=f"Unknown guardrail: {guardrail_id}")
+        if not guardrail.supports_capability(capability):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Guardrail {guardrail_id} does not support {_CAPABILITY_ACTIONS[capability]}"
+            )
+
+        resolved.append((guardrail_id, guardrail, opts_by_gid.get(guardrail_id, _EMPTY_OPTIONS)))
+    return resolved
+
 @app.get("/api/v1/guardrails")
 async def list_guardrails():
     """List all available guardrails and their capabilities."""
     return {"guardrails": registry.list_all()}
 
 @app.post("/api/v1/validate")
-async def validate_content(request: ValidateRequest):
+async def validate_content(request: ValidateRequest = Depends(_parse_validate_request)):
     """Validate content against specified guardrails."""
     results = {
         "is_valid": True,
         "failed_guardrails": [],
         "details": {}
     }
-    
-    for guardrail_id in request.guardrails:
-        guardrail = registry.get(guardrail_id)
-        if not guardrail:
-            raise HTTPException(status_code=400, detail=f"Unknown guardrail: {guardrail_id}")
-            
-        try:
-            # Get guardrail-specific options
-            options = request.options.get(guardrail_id, {}) if request.options else {}
-            
-            validation_result = guardrail.validate(request.content, options)
+
+    # Resolve request.options to a dict exactly once for the whole request
+    opts_by_gid = request.options or _EMPTY_OPTIONS
+
+    # Resolve guardrails and their options once, before any work starts
+    resolved = _resolve_guardrails(request, GuardrailCapability.VALIDATE)
+
+    # Callers that only need the boolean can set "_early_exit": true in
+    # options to stop running guardrails after the first violation
+    early_exit = bool(opts_by_gid.get("_early_exit", False))
+
+    # Guardrails are independent for validation, so fan out and await them all;
+    # latency becomes the cost of the slowest guardrail instead of the sum
+    loop = asyncio.get_running_loop()
+
+    if isinstance(request.content, str):
+        if early_exit:
+            # Run sequentially so later guardrails are skipped entirely after
+            # the first failure
+            for guardrail_id, guardrail, options in resolved:
+                validation_result = await loop.run_in_executor(
+                    _executor, guardrail.validate, request.content, options
+                )
+                results["details"][guardrail_id] = {
+                    "passed": validation_result.passed,
+                    "violations": validation_result.violations
+                }
+
+                if not validation_result.passed:
+                    results["is_valid"] = False
+                    results["failed_guardrails"].append(guardrail_id)
+                    break
+
+            return results
+
+        validation_results = await asyncio.gather(*[
+            loop.run_in_executor(_executor, guardrail.validate, request.content, options)
+            for _, guardrail, options in resolved
+        ])
+
+        for (guardrail_id, _, _), validation_result in zip(resolved, validation_results):
             results["details"][guardrail_id] = {
                 "passed": validation_result.passed,
                 "violations": validation_result.violations
             }
-            
+
             if not validation_result.passed:
                 results["is_valid"] = False
                 results["failed_guardrails"].append(guardrail_id)
-        except NotImplementedError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Guardrail {guardrail_id} does not support validation"
+
+        return results
+
+    # Batched path: one validate_batch call per guardrail over all content items
+    contents = request.content
+
+    # Format the per-content keys once instead of per guardrail per item
+    content_details = [results["details"].setdefault(f"content_{idx}", {}) for idx in range(len(contents))]
+
+    if early_exit:
+        # Run sequentially and stop once every content item has failed
+        still_passing = set(range(len(contents)))
+        for guardrail_id, guardrail, options in resolved:
+            validation_results = await loop.run_in_executor(
+                _executor, guardrail.validate_batch, contents, options
             )
-    
+            for idx, validation_result in enumerate(validation_results):
+                content_details[idx][guardrail_id] = {
+                    "passed": validation_result.passed,
+                    "violations": validation_result.violations
+                }
+
+                if not validation_result.passed:
+                    results["is_valid"] = False
+                    if guardrail_id not in results["failed_guardrails"]:
+                        results["failed_guardrails"].append(guardrail_id)
+                    still_passing.discard(idx)
+
+            if not still_passing:
+                break
+
+        return results
+
+    batch_results = await asyncio.gather(*[
+        loop.run_in_executor(_executor, guardrail.validate_batch, contents, options)
+        for _, guardrail, options in resolved
+    ])
+
+    for (guardrail_id, _, _), validation_results in zip(resolved, batch_results):
+        for details, validation_result in zip(content_details, validation_results):
+            details[guardrail_id] = {
+                "passed": validation_result.passed,
+                "violations": validation_result.violations
+            }
+
+            if not validation_result.passed:
+                results["is_valid"] = False
+                if guardrail_id not in results["failed_guardrails"]:
+                    results["failed_guardrails"].append(guardrail_id)
+
     return results
 
 @app.post("/api/v1/transform")
-async def transform_content(request: TransformRequest):
+async def transform_content(request: TransformRequest = Depends(_parse_transform_request)):
     """Transform content using specified guardrails."""
-    content = request.content
     applied = []
     options = {}
-    
-    for guardrail_id in request.guardrails:
-        guardrail = registry.get(guardrail_id)
-        if not guardrail:
-            raise HTTPException(status_code=400, detail=f"Unknown guardrail: {guardrail_id}")
-            
-        try:
-            # Get guardrail-specific options
-            guardrail_options = request.options.get(guardrail_id, {}) if request.options else {}
-            
-            # Apply transformation
-            result = guardrail.transform(content, guardrail_options)
+
+    # Resolve guardrails and their options once, before any work starts
+    resolved = _resolve_guardrails(request, GuardrailCapability.TRANSFORM)
+
+    if isinstance(request.content, str):
+        content = request.content
+
+        for guardrail_id, guardrail, guardrail_options in resolved:
+            # Apply the sync transformation in a worker thread so the
+            # event loop can serve other requests meanwhile
+            result = await anyio.to_thread.run_sync(guardrail.transform, content, guardrail_options)
             content = result.transformed_content
             applied.append(guardrail_id)
             options[guardrail_id] = {
                 "details": result.details
             }
-        except NotImplementedError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Guardrail {guardrail_id} does not support transformation"
-            )
-    
+
+        return {
+            "transformed_content": content,
+            "applied_transformations": applied,
+            "details": options
+        }
+
+    # Batched path: one transform_batch call per guardrail, chaining the
+    # transformed contents from one guardrail into the next
+    contents = list(request.content)
+
+    for guardrail_id, guardrail, guardrail_options in resolved:
+        # Apply the sync transformation across the whole batch in a
+        # worker thread so the event loop can serve other requests
+        batch_results = await anyio.to_thread.run_sync(guardrail.transform_batch, contents, guardrail_options)
+        contents = [result.transformed_content for result in batch_results]
+        applied.append(guardrail_id)
+        options[guardrail_id] = {
+            "details": [result.details for result in batch_results]
+        }
+
     return {
-        "transformed_content": content,
+        "transformed_content": contents,
         "applied_transformations": applied,
         "details": options
     }
@@ -104,17 +267,12 @@ async def transform_content(request: TransformRequest):
 @app.get("/health")
 async def health_check():
     """Health check endpoint to verify the service is running."""
-    # Check if all registered guardrails are properly initialized
-    guardrails_status = {}
-    for guardrail in registry._guardrails.values():
-        try:
-            if hasattr(guardrail, 'model') and hasattr(guardrail.model, 'is_model_loaded'):
-                guardrails_status[guardrail.id] = guardrail.model.is_model_loaded()
-            else:
-                guardrails_status[guardrail.id] = True
-        except Exception:
-            guardrails_status[guardrail.id] = False
-    
+    # Each guardrail reports its own readiness via the health() hook
+    guardrails_status = {
+        guardrail_id: guardrail.health()
+        for guardrail_id, guardrail in registry._guardrails.items()
+    }
+
     return {
         "status": "healthy",
         "guardrails": guardrails_status
@@ -4,3 +4,7 @@ Guardrails module for implementing safety and quality controls on LLM outputs
 from src.guardrails.base import Guardrail, GuardrailRegistry, GuardrailCapability, ValidationResult, TransformationResult
 from src.guardrails.pii import PIIGuardrail
 from src.guardrails.topic import TopicGuardrail
+from src.guardrails.word_filter import WordFilterGuardrail
+
+# Shared registry instance; import this instead of instantiating GuardrailRegistry
+registry = GuardrailRegistry()
@@ -36,16 +36,35 @@ class Guardrail(ABC):
     def supports_capability(self, capability: GuardrailCapability) -> bool:
         return capability in self._capabilities
 
+    def health(self) -> bool:
+        # Guardrails backed by a model should override this to report readiness
+        return True
+
+    def warmup(self):
+        # Guardrails backed by a model should override this to trigger any
+        # lazy model loading before traffic is served
+        pass
+
     def validate(self, content: str, options: Optional[Dict[str, Any]] = None) -> ValidationResult:
         if not self.supports_capability(GuardrailCapability.VALIDATE):
             raise NotImplementedError(f"Guardrail {self.id} does not support validation")
         return self._validate(content, options or {})
 
+    def validate_batch(self, contents: List[str], options: Optional[Dict[str, Any]] = None) -> List[ValidationResult]:
+        if not self.supports_capability(GuardrailCapability.VALIDATE):
+            raise NotImplementedError(f"Guardrail {self.id} does not support validation")
+        return self._validate_batch(contents, options or {})
+
     def transform(self, content: str, options: Optional[Dict[str, Any]] = None) -> TransformationResult:
         if not self.supports_capability(GuardrailCapability.TRANSFORM):
             raise NotImplementedError(f"Guardrail {self.id} does not support transformation")
         return self._transform(content, options or {})
 
+    def transform_batch(self, contents: List[str], options: Optional[Dict[str, Any]] = None) -> List[TransformationResult]:
+        if not self.supports_capability(GuardrailCapability.TRANSFORM):
+            raise NotImplementedError(f"Guardrail {self.id} does not support transformation")
+        return self._transform_batch(contents, options or {})
+
     @abstractmethod
     def _validate(self, content: str, options: Dict[str, Any]) -> ValidationResult:
         pass
@@ -54,30 +73,40 @@ class Guardrail(ABC):
     def _transform(self, content: str, options: Dict[str, Any]) -> TransformationResult:
         pass
 
-class GuardrailRegistry:
-    _instance = None
-    _guardrails: Dict[str, Guardrail] = {}
+    def _validate_batch(self, contents: List[str], options: Dict[str, Any]) -> List[ValidationResult]:
+        # Fallback for guardrails without a batched implementation
+        return [self._validate(content, options) for content in contents]
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(GuardrailRegistry, cls).__new__(cls)
-        return cls._instance
+    def _transform_batch(self, contents: List[str], options: Dict[str, Any]) -> List[TransformationResult]:
+        # Fallback for guardrails without a batched implementation
+        return [self._transform(content, options) for content in contents]
+
+class GuardrailRegistry:
+    def __init__(self):
+        self._guardrails: Dict[str, Guardrail] = {}
 
     def register(self, guardrail: Guardrail):
         self._guardrails[guardrail.id] = guardrail
+        # Capabilities and options are static after registration, so build the
+        # listing entry once instead of on every GET /api/v1/guardrails
+        options = guardrail.options
+        if hasattr(options, "model_dump"):
+            options = options.model_dump()
+        guardrail._cached_listing = {
+            "id": guardrail.id,
+            "name": guardrail.name,
+            "description": guardrail.description,
+            "supports_validation": guardrail.supports_capability(GuardrailCapability.VALIDATE),
+            "supports_transformation": guardrail.supports_capability(GuardrailCapability.TRANSFORM),
+            "options": options
+        }
 
     def get(self, guardrail_id: str) -> Optional[Guardrail]:
         return self._guardrails.get(guardrail_id)
 
+    def warmup(self):
+        for guardrail in self._guardrails.values():
+            guardrail.warmup()
+
     def list_all(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "id": g.id,
-                "name": g.name,
-                "description": g.description,
-                "supports_validation": g.supports_capability(GuardrailCapability.VALIDATE),
-                "supports_transformation": g.supports_capability(GuardrailCapability.TRANSFORM),
-                "options": g.options
-            }
-            for g in self._guardrails.values()
-        ] 
\ No newline at end of file
+        return [g._cached_listing for g in self._guardrails.values()] 
\ No newline at end of file
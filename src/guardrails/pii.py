@@ -1,32 +1,106 @@
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
 from src.guardrails.base import Guardrail, GuardrailCapability, ValidationResult, TransformationResult
 from src.models.presidio_model import PresidioModel
 import re
-from pydantic import BaseModel, field_validator, ValidationError, validator
+from pydantic import BaseModel, field_validator
 
 from src.guardrails.pii_types import PII_ENTITY_TYPE_MAP
 
+# Frozen view of the supported entity types for C-level membership checks
+_PII_ENTITY_TYPE_KEYS = frozenset(PII_ENTITY_TYPE_MAP)
+
+# Compiled patterns shared between option validation and the detection hot path,
+# so each custom regex is compiled once per process instead of once per call
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE.setdefault(pattern, re.compile(pattern))
+    return compiled
+
+
+# Combined alternation patterns keyed by the (pattern, label) tuple of a
+# custom_regexes configuration, so a request scans the text once instead of
+# once per pattern. None marks configurations that cannot be combined (e.g.
+# patterns with clashing group names) and must fall back to per-pattern scans.
+_COMBINED_PATTERN_CACHE: Dict[tuple, Any] = {}
+
+# Numbered backreferences (\1) and conditionals ((?(1)...)) refer to groups by
+# position, so the wrapper groups the combiner adds would silently renumber
+# them; such patterns must not be combined. The scan is conservative: an
+# escaped backslash before a digit also matches, which only costs the fallback.
+_NUMBERED_GROUP_REF = re.compile(r'\\[1-9]|\(\?\(')
+
+
+def _compile_combined_pattern(custom_regexes: List[Dict[str, str]]):
+    key = tuple((regex["pattern"], regex["label"]) for regex in custom_regexes)
+    if key in _COMBINED_PATTERN_CACHE:
+        return _COMBINED_PATTERN_CACHE[key]
+
+    group_labels = {}
+    parts = []
+    for idx, (pattern, label) in enumerate(key):
+        if _NUMBERED_GROUP_REF.search(pattern):
+            return _COMBINED_PATTERN_CACHE.setdefault(key, None)
+        group = f"g{idx}"
+        group_labels[group] = label
+        parts.append(f"(?P<{group}>{pattern})")
+
+    try:
+        combined = (re.compile("|".join(parts)), group_labels)
+    except re.error:
+        combined = None
+    return _COMBINED_PATTERN_CACHE.setdefault(key, combined)
+
+
+def _check_entity_types(v):
+    for entity_type in v:
+        if entity_type not in _PII_ENTITY_TYPE_KEYS:
+            raise ValueError(f"Invalid entity type: {entity_type}")
+    return v
+
+
+def _check_custom_regexes(v):
+    for regex in v:
+        if 'pattern' not in regex or 'label' not in regex:
+            raise ValueError("Each custom regex must have 'pattern' and 'label' keys.")
+        try:
+            _compile_pattern(regex['pattern'])
+        except re.error:
+            raise ValueError(f"Invalid regex pattern: {regex['pattern']}")
+    return v
+
+
 class Options(BaseModel):
+    """Request-facing options schema; kept as a Pydantic model for the
+    guardrail listing. Per-request merging uses MergedOptions instead."""
     entity_types: List[str] 
     custom_regexes: List[Dict[str, str]]
 
     @field_validator('entity_types')
     def validate_entity_types(cls, v):
-        for entity_type in v:
-            if entity_type not in PII_ENTITY_TYPE_MAP.keys():
-                raise ValueError(f"Invalid entity type: {entity_type}")
-        return v
+        return _check_entity_types(v)
 
     @field_validator('custom_regexes')
     def validate_custom_regexes(cls, v):
-        for regex in v:
-            if 'pattern' not in regex or 'label' not in regex:
-                raise ValueError("Each custom regex must have 'pattern' and 'label' keys.")
-            try:
-                re.compile(regex['pattern'])
-            except re.error:
-                raise ValueError(f"Invalid regex pattern: {regex['pattern']}")
-        return v
+        return _check_custom_regexes(v)
+
+
+@dataclass(frozen=True)
+class MergedOptions:
+    """Lightweight immutable holder for per-request merged options; avoids
+    allocating a full Pydantic model on every call."""
+    entity_types: Tuple[str, ...]
+    custom_regexes: Tuple[Dict[str, str], ...]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "entity_types": list(self.entity_types),
+            "custom_regexes": list(self.custom_regexes)
+        }
 
 class PIIGuardrail(Guardrail):
     def __init__(self):
@@ -52,8 +126,27 @@ class PIIGuardrail(Guardrail):
             ],
             custom_regexes=[]
         )
+        # Immutable snapshot of the defaults for per-request merging
+        self._default_entity_types = tuple(self._options.entity_types)
+        self._default_custom_regexes = tuple(self._options.custom_regexes)
         self.model = PresidioModel()
 
+    def warmup(self):
+        # Run one analysis to trigger spaCy/recognizer loading before traffic
+        self.model.process_text("warmup", self._options.entity_types)
+
+    def _merge_options(self, options: Dict[str, Any]) -> MergedOptions:
+        # Overlay request options on the defaults and validate in a single pass
+        try:
+            entity_types = options.get("entity_types")
+            custom_regexes = options.get("custom_regexes")
+            return MergedOptions(
+                entity_types=tuple(_check_entity_types(entity_types)) if entity_types is not None else self._default_entity_types,
+                custom_regexes=tuple(_check_custom_regexes(custom_regexes)) if custom_regexes is not None else self._default_custom_regexes
+            )
+        except (ValueError, TypeError) as e:
+            raise Exception(f"Error in PII Guardrail: {str(e)}")
+
     def _process_regex_patterns(self, text: str, custom_regexes: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
         Process text with custom regex patterns.
@@ -65,36 +158,50 @@ class PIIGuardrail(Guardrail):
         Returns:
             List of detected entities
         """
+        if not custom_regexes:
+            return []
+
         entities = []
+
+        # Scan the text once with a combined alternation of all patterns
+        combined = _compile_combined_pattern(custom_regexes)
+        if combined is not None:
+            pattern, group_labels = combined
+            for match in pattern.finditer(text):
+                # lastgroup is normally the wrapper group; if the user pattern
+                # ends with its own named group, fall back to probing wrappers
+                label = group_labels.get(match.lastgroup)
+                if label is None:
+                    label = next(lbl for group, lbl in group_labels.items() if match.group(group) is not None)
+                entities.append({
+                    "text": match.group(),
+                    "label": f"CUSTOM_{label}",
+                    "start": match.start(),
+                    "end": match.end()
+                })
+            return entities
+
+        # Fall back to one scan per pattern when the alternation cannot be
+        # built; the Options validator already guarantees each individual
+        # pattern compiles, so no error handling is needed here
         for regex_config in custom_regexes:
-            pattern = regex_config["pattern"]
             label = regex_config["label"]
-            
-            try:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    entities.append({
-                        "text": match.group(),
-                        "label": f"CUSTOM_{label}",
-                        "start": match.start(),
-                        "end": match.end()
-                    })
-            except re.error:
-                print(f"Invalid regex pattern: {pattern}")
-                continue
-                
+            for match in _compile_pattern(regex_config["pattern"]).finditer(text):
+                entities.append({
+                    "text": match.group(),
+                    "label": f"CUSTOM_{label}",
+                    "start": match.start(),
+                    "end": match.end()
+                })
+
         return entities
 
     def _validate(self, content: str, options: Dict[str, Any]) -> ValidationResult:
         # Override default options with any provided in context
-        try:
-            merged_options = self._options.model_copy(update=options)
-            Options.model_validate(merged_options.model_dump())
-        except ValidationError as e:
-            raise Exception(f"Error in PII Guardrail: {str(e)}")
+        merged_options = self._merge_options(options)
         
         # Get model-based detections
-        _, model_entities = self.model.process_text(content, merged_options.model_dump())
+        _, model_entities = self.model.process_text(content, merged_options.entity_types)
         
         # Get regex-based detections
         custom_regexes = merged_options.custom_regexes
@@ -114,17 +221,35 @@ class PIIGuardrail(Guardrail):
             violations=violations,
         )
 
+    def _validate_batch(self, contents: List[str], options: Dict[str, Any]) -> List[ValidationResult]:
+        # Merge the options once for the whole batch
+        merged_options = self._merge_options(options)
+
+        # One batched model call for all contents
+        processed = self.model.process_texts(contents, merged_options.entity_types)
+
+        custom_regexes = merged_options.custom_regexes
+        results = []
+        for content, (_, model_entities) in zip(contents, processed):
+            regex_entities = self._process_regex_patterns(content, custom_regexes)
+            all_entities = model_entities + regex_entities
+
+            violations = [
+                f"Found {entity['label']} PII: {entity['text']}"
+                for entity in all_entities
+            ]
+            results.append(ValidationResult(
+                passed=len(violations) == 0,
+                violations=violations,
+            ))
+        return results
+
     def _transform(self, content: str, options: Dict[str, Any]) -> TransformationResult:
         # Merge default options with provided options
-        try:
-            merged_options = self._options.model_copy(update=options)
-            Options.model_validate(merged_options.model_dump())
-        except ValidationError as e:
-            raise Exception(f"Error in PII Guardrail: {str(e)}")
-        
-        
+        merged_options = self._merge_options(options)
+
         # Get model-based detections and transformed text
-        processed_text, model_entities = self.model.process_text(content, merged_options.model_dump())
+        processed_text, model_entities = self.model.process_text(content, merged_options.entity_types)
         
         # Get regex-based detections
         custom_regexes = merged_options.custom_regexes
@@ -132,19 +257,23 @@ class PIIGuardrail(Guardrail):
         
         # Apply regex transformations
         if regex_entities:
-            # Sort entities by start position in reverse order to avoid offset issues
-            regex_entities.sort(key=lambda x: x["start"], reverse=True)
-            
-            # Convert processed_text back to mutable string
-            processed_text = list(processed_text)
-            
-            # Replace each regex match with [PII]
+            # Walk the entities in order, emitting the text between matches and
+            # [PII] for each match, then join once — O(n + k) with no
+            # char-by-char list conversion
+            regex_entities.sort(key=lambda x: x["start"])
+
+            segments = []
+            pos = 0
             for entity in regex_entities:
-                start, end = entity["start"], entity["end"]
-                processed_text[start:end] = "[PII]"
-            
-            # Convert back to string
-            processed_text = "".join(processed_text)
+                if entity["start"] < pos:
+                    # Overlaps a span already replaced
+                    continue
+                segments.append(processed_text[pos:entity["start"]])
+                segments.append("[PII]")
+                pos = entity["end"]
+            segments.append(processed_text[pos:])
+
+            processed_text = "".join(segments)
         
         # Combine all detected entities
         all_entities = model_entities + regex_entities
@@ -159,6 +288,6 @@ class PIIGuardrail(Guardrail):
                     }
                     for entity in all_entities
                 ],
-                "applied_options": merged_options.model_dump()
+                "applied_options": merged_options.as_dict()
             }
         ) 
\ No newline at end of file
@@ -2,7 +2,6 @@ from typing import Any, Dict, List
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, ValidationError, field_validator
-from sentence_transformers import SentenceTransformer, util
 
 from src.guardrails.base import (Guardrail, GuardrailCapability, TransformationResult,
                        ValidationResult)
@@ -44,21 +43,35 @@ class TopicGuardrail(Guardrail):
             ],
             threshold=0.5  # Default threshold for topic detection
         )
+        # Dump the defaults once; per-request merging overlays the provided
+        # options on this dict and validates a single time
+        self._default_options = self._options.model_dump()
         self.model = ZeroShotModel()
 
-    def _validate(self, content: str, options: Dict[str, Any]) -> ValidationResult:
+    def _merge_options(self, options: Dict[str, Any]) -> TopicOptions:
         # Merge default options with provided options
         try:
-            merged_options = self._options.model_copy(update=options)
-            TopicOptions.model_validate(merged_options.model_dump())
+            return TopicOptions(**{**self._default_options, **options})
         except ValidationError as e:
             raise Exception(f"Error in Topic Guardrail: {str(e)}")
-        
+
+    def health(self) -> bool:
+        return self.model.is_model_loaded()
+
+    def warmup(self):
+        # Run one classification to trigger model loading before traffic
+        self.model.detect_topics("warmup", ["warmup"], threshold=1.0)
+
+    def _validate(self, content: str, options: Dict[str, Any]) -> ValidationResult:
+        merged_options = self._merge_options(options)
+
         denied_topics = merged_options.denied_topics
         threshold = merged_options.threshold
         
-        # Detect denied topics
-        detected_topics = self.model.detect_topics(content, denied_topics, threshold)
+        # Detect denied topics; validation only needs pass/fail, so one
+        # violating topic is enough
+        detected_topics = self.model.detect_topics(content, denied_topics, threshold,
+                                                   first_match_only=True)
         
         # If any denied topic is detected, validation fails
         violations = [
@@ -70,5 +83,29 @@ class TopicGuardrail(Guardrail):
             passed=len(violations) == 0,
             violations=violations,
         )
+
+    def _validate_batch(self, contents: List[str], options: Dict[str, Any]) -> List[ValidationResult]:
+        merged_options = self._merge_options(options)
+
+        denied_topics = merged_options.denied_topics
+        threshold = merged_options.threshold
+
+        # One batched model call for all contents; validation only needs
+        # pass/fail, so one violating topic per content is enough
+        detected_per_content = self.model.detect_topics_batch(contents, denied_topics, threshold,
+                                                              first_match_only=True)
+
+        results = []
+        for detected_topics in detected_per_content:
+            violations = [
+                f"Content related to denied topic '{topic['topic']}'"
+                for topic in detected_topics
+            ]
+            results.append(ValidationResult(
+                passed=len(violations) == 0,
+                violations=violations,
+            ))
+        return results
+
     def _transform(self, content: str, options: Dict[str, Any]) -> TransformationResult:
         raise NotImplementedError("Transformation is not supported by TopicGuardrail")
\ No newline at end of file
@@ -0,0 +1,305 @@
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from pydantic import BaseModel, ValidationError, field_validator
+
+from src.guardrails.base import (Guardrail, GuardrailCapability, TransformationResult,
+                       ValidationResult)
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # google-re2 matches large alternations in linear time with no backtracking;
+    # its module mirrors the stdlib re API
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+try:
+    # Hyperscan scans all patterns simultaneously with SIMD; preferred engine
+    # for ASCII content when the bindings are installed
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Built-in profanity list; callers extend or replace it via options
+DEFAULT_WORD_LIST = [
+    "damn",
+    "hell",
+    "crap",
+    "bastard",
+    "bollocks"
+]
+
+# Engine structures are cached per normalized word tuple with the same
+# bounded lru_cache the other helpers use: word lists arrive from request
+# options, so an unbounded dict would grow with every distinct list a
+# client sends
+
+
+@lru_cache(maxsize=128)
+def _get_hyperscan_db(words: Tuple[str, ...]):
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(word).encode() for word in words],
+        ids=list(range(len(words))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(words)
+    )
+    return db
+
+
+# Hyperscan scratch space supports one scan at a time, and /validate fans
+# guardrail calls out across a thread pool, so each thread keeps its own
+# scratch per database instead of sharing the database's implicit one
+_SCRATCH_LOCAL = threading.local()
+
+
+def _get_scratch(words: Tuple[str, ...], db):
+    scratches = getattr(_SCRATCH_LOCAL, "scratches", None)
+    if scratches is None:
+        scratches = _SCRATCH_LOCAL.scratches = {}
+    entry = scratches.get(words)
+    # Rebuild when the cached database was evicted and recompiled
+    if entry is None or entry[0] is not db:
+        if len(scratches) >= 128:
+            # Mirror the database cache bound
+            scratches.clear()
+        entry = scratches[words] = (db, hyperscan.Scratch(db))
+    return entry[1]
+
+
+def _hyperscan_scan(words: Tuple[str, ...], haystack: str) -> List[Tuple[int, int]]:
+    raw = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        raw.append((start, end))
+
+    db = _get_hyperscan_db(words)
+    db.scan(haystack.encode(), match_event_handler=on_match, scratch=_get_scratch(words, db))
+    return raw
+
+
+@lru_cache(maxsize=128)
+def _get_automaton(words: Tuple[str, ...]):
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Maps every non-word ASCII char to a space so tokenization becomes
+# translate + split, which runs at C speed with no regex machinery; only
+# valid for ASCII haystacks
+_NON_WORD_TABLE = str.maketrans({
+    c: ' ' for c in map(chr, range(128)) if not (c.isalnum() or c == '_')
+})
+
+
+@lru_cache(maxsize=128)
+def _word_set(words: Tuple[str, ...]) -> frozenset:
+    return frozenset(words)
+
+
+@lru_cache(maxsize=128)
+def _all_single_tokens(words: Tuple[str, ...]) -> bool:
+    return all(_TOKEN_RE.fullmatch(word) for word in words)
+
+
+@lru_cache(maxsize=128)
+def _compile_filter(words: Tuple[str, ...], whole_words_only: bool,
+                    ignore_case: bool = False) -> re.Pattern:
+    # Words normally arrive pre-normalized for case, so no IGNORECASE:
+    # case-folding at match time defeats the engine's fast literal scanning.
+    # ignore_case exists for the rare content where lowercasing changes the
+    # string length and the normalized haystack cannot be used.
+    # Longer alternatives first so the regex engine prefers the longest word
+    escaped = sorted((re.escape(word) for word in words), key=len, reverse=True)
+    body = "|".join(escaped)
+    if whole_words_only:
+        body = r"\b(?:%s)\b" % body
+    return _regex_engine.compile(body, re.IGNORECASE if ignore_case else 0)
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+        return False
+    if end < len(text) and (text[end].isalnum() or text[end] == '_'):
+        return False
+    return True
+
+
+def _resolve_spans(raw: List[Tuple[int, int]], haystack: str, whole_words_only: bool) -> List[Tuple[int, int]]:
+    """Filter raw (start, end) spans down to the leftmost-longest
+    non-overlapping matches, applying word-boundary checks if requested.
+
+    Multi-pattern engines report every occurrence, including overlapping
+    substrings, so the spans must be resolved before use."""
+    if whole_words_only:
+        raw = [span for span in raw if _is_whole_word(haystack, span[0], span[1])]
+    raw.sort(key=lambda span: (span[0], span[0] - span[1]))
+    matches = []
+    last_end = 0
+    for start, end in raw:
+        if start >= last_end:
+            matches.append((start, end))
+            last_end = end
+    return matches
+
+
+class WordFilterOptions(BaseModel):
+    word_list: List[str]
+    case_sensitive: bool
+    whole_words_only: bool
+    replacement: str
+
+    @field_validator('word_list')
+    def validate_word_list(cls, v):
+        if not v:
+            raise ValueError("Word list cannot be empty.")
+        # A blank word would become an empty regex alternative matching at
+        # every position
+        if any(not word.strip() for word in v):
+            raise ValueError("Word list entries cannot be empty or blank.")
+        return v
+
+
+class WordFilterGuardrail(Guardrail):
+    def __init__(self):
+        super().__init__(
+            id="words",
+            name="Word Filter",
+            description="Detects and filters configured words and phrases"
+        )
+        self._capabilities.add(GuardrailCapability.VALIDATE)
+        self._capabilities.add(GuardrailCapability.TRANSFORM)
+        self._options = WordFilterOptions(
+            word_list=DEFAULT_WORD_LIST,
+            case_sensitive=False,
+            whole_words_only=True,
+            replacement="***"
+        )
+        # Dump the defaults once; per-request merging overlays the provided
+        # options on this dict and validates a single time
+        self._default_options = self._options.model_dump()
+
+    def _merge_options(self, options: Dict[str, Any]) -> WordFilterOptions:
+        # Merge default options with provided options
+        try:
+            return WordFilterOptions(**{**self._default_options, **options})
+        except ValidationError as e:
+            raise Exception(f"Error in Word Filter Guardrail: {str(e)}")
+
+    def _find_matches(self, content: str, merged_options: WordFilterOptions) -> List[Tuple[int, int]]:
+        """
+        Find (start, end) spans of filtered words in content.
+
+        Prefers Hyperscan (SIMD multi-pattern scan) for ASCII content, then an
+        Aho-Corasick automaton — both a single linear pass regardless of
+        word-list size — and falls back to a regex alternation otherwise.
+        """
+        if merged_options.case_sensitive:
+            haystack = content
+            words = tuple(sorted(set(merged_options.word_list)))
+        else:
+            haystack = content.lower()
+            words = tuple(sorted({word.lower() for word in merged_options.word_list}))
+            if len(haystack) != len(content):
+                # Rare: lowercasing changed the length (e.g. 'İ' lowers to two
+                # code points), so haystack spans would not line up with the
+                # original content. Scan the content case-insensitively so the
+                # spans the callers slice with stay valid.
+                pattern = _compile_filter(words, merged_options.whole_words_only, ignore_case=True)
+                return [(match.start(), match.end()) for match in pattern.finditer(content)]
+
+        # Whole-word matching over single-token words is plain set membership:
+        # tokenize once and hash-probe each token, no pattern scan at all
+        if merged_options.whole_words_only and _all_single_tokens(words):
+            word_set = _word_set(words)
+            # Clean content is the common case: a translate + split tokenizes
+            # ASCII haystacks at C speed, and a disjoint word set means no
+            # spans to recover, so the regex tokenizer never runs
+            if haystack.isascii() and word_set.isdisjoint(haystack.translate(_NON_WORD_TABLE).split()):
+                return []
+            return [
+                (match.start(), match.end())
+                for match in _TOKEN_RE.finditer(haystack)
+                if match.group() in word_set
+            ]
+
+        if hyperscan is not None or ahocorasick is not None:
+            # Hyperscan reports byte offsets, which only line up with string
+            # indices for ASCII content
+            if hyperscan is not None and haystack.isascii():
+                raw = _hyperscan_scan(words, haystack)
+                return _resolve_spans(raw, haystack, merged_options.whole_words_only)
+
+            if ahocorasick is not None:
+                automaton = _get_automaton(words)
+                raw = []
+                for end_index, word in automaton.iter(haystack):
+                    raw.append((end_index - len(word) + 1, end_index + 1))
+                return _resolve_spans(raw, haystack, merged_options.whole_words_only)
+
+        # Scan the normalized haystack; callers slice the original content by
+        # the returned spans, so matched text keeps its original casing
+        pattern = _compile_filter(words, merged_options.whole_words_only)
+        return [(match.start(), match.end()) for match in pattern.finditer(haystack)]
+
+    def _validate(self, content: str, options: Dict[str, Any]) -> ValidationResult:
+        merged_options = self._merge_options(options)
+
+        matches = self._find_matches(content, merged_options)
+
+        violations = [
+            f"Found filtered word: {content[start:end]}"
+            for start, end in matches
+        ]
+
+        return ValidationResult(
+            passed=len(violations) == 0,
+            violations=violations,
+        )
+
+    def _transform(self, content: str, options: Dict[str, Any]) -> TransformationResult:
+        merged_options = self._merge_options(options)
+
+        matches = self._find_matches(content, merged_options)
+
+        # Nothing matched: return the content untouched instead of
+        # reassembling an identical copy
+        if not matches:
+            return TransformationResult(
+                transformed_content=content,
+                details={
+                    "filtered_words": [],
+                    "applied_options": merged_options.model_dump()
+                }
+            )
+
+        # Emit the text between matches plus the replacement, then join once
+        replacement = merged_options.replacement
+        filtered_words = []
+        segments = []
+        pos = 0
+        for start, end in matches:
+            filtered_words.append(content[start:end])
+            segments.append(content[pos:start])
+            segments.append(replacement)
+            pos = end
+        segments.append(content[pos:])
+
+        return TransformationResult(
+            transformed_content="".join(segments),
+            details={
+                "filtered_words": filtered_words,
+                "applied_options": merged_options.model_dump()
+            }
+        )
@@ -1,19 +1,54 @@
-from typing import Any, Dict, List, Tuple
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from presidio_analyzer import AnalyzerEngine
+from presidio_analyzer import AnalyzerEngine, EntityRecognizer
 from presidio_analyzer.nlp_engine import SpacyNlpEngine
 from presidio_anonymizer import AnonymizerEngine, OperatorConfig
 
 from src.guardrails.pii_types import PII_ENTITY_TYPE_MAP
 
+# Presidio entities whose recognizers consume spaCy NLP artifacts (NER);
+# every other supported entity is detected by pure pattern/checksum
+# recognizers that never look at the artifacts
+_NLP_DEPENDENT_ENTITIES = frozenset({"PERSON", "LOCATION", "ORGANIZATION", "DATE_TIME", "NRP"})
+
+# Process-wide engine singletons: AnalyzerEngine construction loads the full
+# spaCy pipeline, so every PresidioModel shares one lazily built instance
+_ANALYZER: Optional[AnalyzerEngine] = None
+_ANONYMIZER: Optional[AnonymizerEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+# Pool for fanning batch items out across threads; spaCy releases the GIL
+# inside its C extensions, so concurrent analyze calls overlap on cores
+_BATCH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+@lru_cache(maxsize=256)
+def _resolve_entities(entity_types: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Entity-type sets are stable across requests, so the map translation is
+    # memoized on the tuple of requested types
+    return tuple(PII_ENTITY_TYPE_MAP[entity] for entity in entity_types)
+
+
+def _get_engines() -> Tuple[AnalyzerEngine, AnonymizerEngine]:
+    global _ANALYZER, _ANONYMIZER
+    if _ANALYZER is None:
+        with _ENGINE_LOCK:
+            if _ANALYZER is None:
+                _ANONYMIZER = AnonymizerEngine()
+                _ANALYZER = AnalyzerEngine(nlp_engine=SpacyNlpEngine())
+    return _ANALYZER, _ANONYMIZER
+
 
 class PresidioModel:
     """
     A model for PII detection and anonymization using Microsoft Presidio.
     """
     def __init__(self):
-        self.analyzer = AnalyzerEngine(nlp_engine=SpacyNlpEngine())
-        self.anonymizer = AnonymizerEngine()
+        self.analyzer, self.anonymizer = _get_engines()
 
     def analyze_text(self, text: str, entities: List[str], language: str = 'en'):
         """
@@ -27,9 +62,25 @@ class PresidioModel:
         Returns:
             List of detected entities.
         """
+        # Pattern-only entity sets can skip the spaCy pipeline entirely,
+        # which dominates analyze latency
+        if not _NLP_DEPENDENT_ENTITIES.intersection(entities):
+            return self._analyze_patterns_only(text, entities, language)
         # Convert PIIEntityType to string values for Presidio
         return self.analyzer.analyze(text=text, entities=entities, language=language)
 
+    def _analyze_patterns_only(self, text: str, entities: List[str], language: str = 'en'):
+        """
+        Run only the pattern recognizers for the requested entities.
+
+        Bypasses the NLP engine: pattern and checksum recognizers ignore NLP
+        artifacts, so running spaCy for them is pure overhead.
+        """
+        results = []
+        for recognizer in self.analyzer.registry.get_recognizers(language=language, entities=entities):
+            results.extend(recognizer.analyze(text, entities, nlp_artifacts=None))
+        return EntityRecognizer.remove_duplicates(results)
+
     def anonymize_text(self, text: str, analyzer_results: List[Dict[str, Any]]) -> object:
         """
         Anonymize the text based on the analysis results.
@@ -44,21 +95,21 @@ class PresidioModel:
         return self.anonymizer.anonymize(text=text, analyzer_results=analyzer_results,
                                         operators={"DEFAULT": OperatorConfig("replace", {"new_value": "[REDACTED]"})})
 
-    def process_text(self, text: str, options: Dict[str, Any] = None) -> Tuple[str, List[Dict[str, str]]]:
+    def process_text(self, text: str, entity_types: List[str]) -> Tuple[str, List[Dict[str, str]]]:
         """
         Process input text to detect and obscure PII.
-        
+
         Args:
             text: Input text to process
-            options: Dictionary of options for processing (not used in this implementation)
-            
+            entity_types: PII entity types to detect
+
         Returns:
             Tuple containing:
             - Processed text with PII obscured
             - List of detected PII entities
         """
         # Analyze the text
-        analyzer_results = self.analyze_text(text, [PII_ENTITY_TYPE_MAP[entity] for entity in options.get('entity_types')])
+        analyzer_results = self.analyze_text(text, list(_resolve_entities(tuple(entity_types))))
         # Anonymize the text
         anonymized_output = self.anonymize_text(text, analyzer_results)
 
@@ -73,4 +124,21 @@ class PresidioModel:
             for result in analyzer_results
         ]
 
-        return anonymized_output.text, entities 
\ No newline at end of file
+        return anonymized_output.text, entities
+
+    def process_texts(self, texts: List[str], entity_types: List[str]) -> List[Tuple[str, List[Dict[str, str]]]]:
+        """
+        Process a batch of texts to detect and obscure PII.
+
+        Args:
+            texts: Input texts to process
+            entity_types: PII entity types to detect
+
+        Returns:
+            List of (processed text, detected entities) tuples, one per input
+        """
+        if len(texts) == 1:
+            return [self.process_text(texts[0], entity_types)]
+        # Analyze is read-only after engine init, so the shared engines are
+        # safe to use from multiple threads
+        return list(_BATCH_POOL.map(lambda text: self.process_text(text, entity_types), texts)) 
\ No newline at end of file
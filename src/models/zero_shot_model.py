@@ -1,11 +1,95 @@
+import logging
 import os
-from typing import Any, Dict, List
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
+import numpy as np
+import torch
 from dotenv import load_dotenv
 from transformers import pipeline
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Micro-batching knobs: how many concurrent requests to coalesce into one
+# pipeline call and how long to wait for stragglers
+_MAX_BATCH = int(os.getenv("ZERO_SHOT_MAX_BATCH", 16))
+_MAX_WAIT_S = float(os.getenv("ZERO_SHOT_BATCH_WAIT_MS", 10)) / 1000.0
+
+# Token cap for classification input; attention cost is quadratic in sequence
+# length, so unbounded input is a latency cliff
+_MAX_SEQ_LENGTH = int(os.getenv("ZERO_SHOT_MAX_LENGTH", 256))
+
+
+def _threshold_scores(topics: List[str], scores: Tuple[float, ...], threshold: float,
+                      first_match_only: bool) -> List[Dict[str, Any]]:
+    # Vectorized comparison keeps the per-topic cost out of the Python loop,
+    # which matters once batching inflates the candidate-topic count
+    score_arr = np.asarray(scores)
+    if first_match_only:
+        best = int(score_arr.argmax())
+        if score_arr[best] >= threshold:
+            return [{"topic": topics[best], "score": float(score_arr[best])}]
+        return []
+    return [
+        {"topic": topics[i], "score": float(score_arr[i])}
+        for i in np.flatnonzero(score_arr >= threshold)
+    ]
+
+
+class _MicroBatcher:
+    """
+    Coalesces concurrent classification requests into batched model calls.
+
+    Callers submit from worker threads and block on a Future; a background
+    thread drains the queue, waiting up to _MAX_WAIT_S for a batch to fill,
+    then dispatches one batched call per distinct candidate-topic set.
+    """
+    def __init__(self, run_batch: Callable, max_batch: int = _MAX_BATCH, max_wait: float = _MAX_WAIT_S):
+        self._run_batch = run_batch
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str, topics: Tuple[str, ...]) -> Tuple[float, ...]:
+        future = Future()
+        self._queue.put((text, topics, future))
+        return future.result()
+
+    def _loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # Requests sharing a candidate-topic set can share a forward pass
+            groups: Dict[Tuple[str, ...], List] = {}
+            for text, topics, future in batch:
+                groups.setdefault(topics, []).append((text, future))
+
+            for topics, entries in groups.items():
+                try:
+                    score_rows = self._run_batch([text for text, _ in entries], topics)
+                    for (_, future), scores in zip(entries, score_rows):
+                        future.set_result(scores)
+                except Exception as e:
+                    for _, future in entries:
+                        future.set_exception(e)
+
 
 class ZeroShotModel:
     """
@@ -14,17 +98,59 @@ class ZeroShotModel:
     def __init__(self, model_name: str = None):
         self.model_name = model_name or os.getenv("ZERO_SHOT_MODEL_NAME")
         self.model = None
-        self.load_model()
+        # Memoize per-(text, topics) scores so repeated identical inputs skip
+        # inference entirely; thresholding happens after the cache
+        self._classify_cached = lru_cache(maxsize=256)(self._classify)
+        # Coalesce concurrent single-text requests into batched forward passes
+        self._batcher = _MicroBatcher(self._classify_batch)
+        # Loading is deferred to the first detection call (or an explicit
+        # warmup) so processes that never exercise the topic guardrail skip
+        # the model load entirely
+        self._load_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        if self.model is None:
+            with self._load_lock:
+                if self.model is None:
+                    self.load_model()
+
+    def _classify(self, text: str, topics: Tuple[str, ...]) -> Tuple[float, ...]:
+        return self._batcher.submit(text, topics)
+
+    def _classify_batch(self, texts: List[str], topics: Tuple[str, ...]) -> List[Tuple[float, ...]]:
+        # One forward pass scores all candidate labels; multi_label=True keeps
+        # an independent entailment score per topic, matching the previous
+        # one-call-per-topic semantics
+        results = self.model(list(texts), candidate_labels=list(topics), multi_label=True)
+        if isinstance(results, dict):
+            results = [results]
+
+        score_rows = []
+        for result in results:
+            scores_by_label = dict(zip(result['labels'], result['scores']))
+            score_rows.append(tuple(scores_by_label[topic] for topic in topics))
+        return score_rows
 
     def load_model(self):
         """
         Load the zero-shot-classification model from Hugging Face.
         """
         try:
-            self.model = pipeline("zero-shot-classification", model=self.model_name, device=0)
-            print(f"Model loaded successfully: {self.model_name}")
-        except Exception as e:
-            print(f"Error loading model: {str(e)}")
+            # Half-precision halves memory bandwidth and enables tensor cores
+            # on GPU; bf16 is preferred on hardware that supports it
+            if torch.cuda.is_available():
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            else:
+                dtype = torch.float32
+            self.model = pipeline("zero-shot-classification", model=self.model_name, device=0, torch_dtype=dtype)
+            # Truncate long inputs at the tokenizer so worst-case latency is
+            # bounded; the zero-shot pipeline truncates to model_max_length
+            self.model.tokenizer.model_max_length = min(
+                _MAX_SEQ_LENGTH, self.model.tokenizer.model_max_length
+            )
+            logger.info("Model loaded: %s", self.model_name)
+        except Exception:
+            logger.exception("Error loading model %s", self.model_name)
             raise
 
     def is_model_loaded(self) -> bool:
@@ -33,7 +159,8 @@ class ZeroShotModel:
         """
         return self.model is not None
 
-    def detect_topics(self, text: str, denied_topics: List[str], threshold: float = 0.5) -> List[Dict[str, Any]]:
+    def detect_topics(self, text: str, denied_topics: List[str], threshold: float = 0.5,
+                      first_match_only: bool = False) -> List[Dict[str, Any]]:
         """
         Detect if text relates to any of the denied topics.
         
@@ -41,22 +168,37 @@ class ZeroShotModel:
             text: Input text to process
             denied_topics: List of denied topics to check against
             threshold: Threshold value for topic relevance (0-1)
+            first_match_only: Return only the strongest violating topic;
+                useful for callers that just need a pass/fail signal
             
         Returns:
             List of detected topics with their scores
         """
-        if not self.is_model_loaded():
-            raise Exception("Model not loaded")
-
-        detected_topics = []
-        for topic in denied_topics:
-            result = self.model(text, [topic])
-            label = result['labels'][0]
-            score = result['scores'][0]
-            if label == topic and score >= threshold:
-                detected_topics.append({
-                    "topic": topic,
-                    "score": score
-                })
-
-        return detected_topics 
\ No newline at end of file
+        self._ensure_loaded()
+
+        scores = self._classify_cached(text, tuple(denied_topics))
+        return _threshold_scores(denied_topics, scores, threshold, first_match_only)
+
+    def detect_topics_batch(self, texts: List[str], denied_topics: List[str], threshold: float = 0.5,
+                            first_match_only: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Detect denied topics for a batch of texts in a single pipeline call.
+
+        Args:
+            texts: Input texts to process
+            denied_topics: List of denied topics to check against
+            threshold: Threshold value for topic relevance (0-1)
+
+        Returns:
+            List of detected-topic lists, one per input text
+        """
+        self._ensure_loaded()
+
+        # One call scores every (text, topic) pair; list inputs already batch,
+        # so this bypasses the coalescer
+        score_rows = self._classify_batch(texts, tuple(denied_topics))
+
+        return [
+            _threshold_scores(denied_topics, scores, threshold, first_match_only)
+            for scores in score_rows
+        ] 
\ No newline at end of file